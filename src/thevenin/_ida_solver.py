@@ -50,14 +50,22 @@ class SolverReturn:
 
             sorted_pairs = sorted(zip(order, labels))
 
+            t_last = self._t[-1]
+            new_lines = []
+
             for i, label in sorted_pairs:
                 setattr(self, '_' + label, (True, i))
 
                 new_line = getattr(solution, label)
-                if self.t[-1] < new_line.t:
-                    self._t = np.hstack([self._t, new_line.t])
-                    self._y = np.vstack([self._y, new_line.y])
-                    self._ydot = np.vstack([self._ydot, new_line.ydot])
+                if t_last < new_line.t:
+                    t_last = new_line.t
+                    new_lines.append(new_line)
+
+            if len(new_lines) != 0:
+                self._t = np.hstack([self._t, *[x.t for x in new_lines]])
+                self._y = np.vstack([self._y, *[x.y for x in new_lines]])
+                self._ydot = np.vstack([self._ydot,
+                                        *[x.ydot for x in new_lines]])
 
     def __repr__(self) -> str:  # pragma: no cover
         """
@@ -6,7 +6,6 @@ import time
 import warnings
 
 import numpy as np
-import scipy.sparse as sparse
 from ruamel.yaml import YAML, add_constructor, SafeConstructor
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -168,12 +167,13 @@ class Model:
         ptr = {}
         ptr['soc'] = 0
         ptr['T_cell'] = 1
-        ptr['eta_j'] = np.arange(2, 2 + self.num_RC_pairs)
+        ptr['eta_j'] = slice(2, 2 + self.num_RC_pairs)
         ptr['V_cell'] = self.num_RC_pairs + 2
         ptr['size'] = self.num_RC_pairs + 3
 
         algidx = [ptr['V_cell']]
 
+        # the mass matrix is diagonal, so only the diagonal is stored
         mass_matrix = np.zeros(ptr['size'])
         mass_matrix[ptr['soc']] = 1.
         mass_matrix[ptr['T_cell']] = self.mass*self.Cp*self.T_inf
@@ -189,7 +189,7 @@ class Model:
 
         self._ptr = ptr
         self._algidx = algidx
-        self._mass_matrix = sparse.diags(mass_matrix)
+        self._mass_matrix = mass_matrix
         self._sv0 = sv0
         self._svdot0 = svdot0
 
@@ -243,18 +243,23 @@ class Model:
         rhs[self._ptr['T_cell']] = (Q_gen + Q_conv) * (1 - self.isothermal)
 
         # RC overpotentials (differential)
-        for j, ptr in enumerate(self._ptr['eta_j'], start=1):
+        eta_ptr = self._ptr['eta_j']
+        for j, ptr in enumerate(range(eta_ptr.start, eta_ptr.stop), start=1):
             Rj = getattr(self, 'R' + str(j))(soc, T_cell)
             Cj = getattr(self, 'C' + str(j))(soc, T_cell)
             rhs[ptr] = -sv[ptr] / (Rj*Cj) + current / Cj
 
-        # cell voltage (algebraic)
+        # cell voltage (algebraic), constant loads are used as is
+        value = inputs['value']
+        if callable(value):
+            value = value(t)
+
         if inputs['mode'] == 'current':
-            rhs[self._ptr['V_cell']] = current - inputs['value'](t)
+            rhs[self._ptr['V_cell']] = current - value
         elif inputs['mode'] == 'voltage':
-            rhs[self._ptr['V_cell']] = voltage - inputs['value'](t)
+            rhs[self._ptr['V_cell']] = voltage - value
         elif inputs['mode'] == 'power':
-            rhs[self._ptr['V_cell']] = power - inputs['value'](t)
+            rhs[self._ptr['V_cell']] = power - value
 
         # values for rootfns
         total_time = self._t0 + t
@@ -301,7 +306,11 @@ class Model:
             DAE residuals, res = M*ydot - rhs(t, y).
 
         """
-        return self._mass_matrix.dot(svdot) - self.rhs_funcs(t, sv, inputs)
+
+        res = np.empty_like(svdot, dtype=float)
+        self._residuals(t, sv, svdot, res, inputs)
+
+        return res
 
     def run_step(self, exp: Experiment, stepidx: int) -> StepSolution:
         """
@@ -349,10 +358,6 @@ class Model:
         step = exp.steps[stepidx].copy()
         kwargs = exp._kwargs[stepidx].copy()
 
-        if not callable(step['value']):
-            value = step['value']
-            step['value'] = lambda t: value
-
         kwargs['inputs'] = step
         kwargs['algidx'] = self._algidx
 
@@ -418,7 +423,8 @@ class Model:
 
         The IDASolver requires a residuals function in this exact form.
         Rather than outputting the residuals, the function returns None,
-        but fills the 'res' input array with the DAE residuals.
+        but fills the 'res' input array with the DAE residuals. This is
+        called at every solver iteration, so 'res' is filled in place.
 
         Parameters
         ----------
@@ -439,7 +445,8 @@ class Model:
 
         """
 
-        res[:] = self.residuals(t, sv, svdot, inputs)
+        np.multiply(self._mass_matrix, svdot, out=res)
+        res -= self.rhs_funcs(t, sv, inputs)
 
 
 class _RootFunction:
@@ -57,8 +57,11 @@ class BaseSolution(SolverReturn):
 
         """
 
+        # look up first, so invalid keys don't leave an empty figure open
+        xdata, ydata = self.vars[x], self.vars[y]
+
         plt.figure()
-        plt.plot(self.vars[x], self.vars[y], **kwargs)
+        plt.plot(xdata, ydata, **kwargs)
 
         if '_' in x:
             variable, units = x.split('_')
@@ -99,10 +102,20 @@ class BaseSolution(SolverReturn):
         eta_j = self.y[:, ptr['eta_j']]
         voltage = self.y[:, ptr['V_cell']]
 
-        ocv = model.ocv(soc)
         R0 = model.R0(soc, T_cell)
 
-        current = -(voltage - ocv + np.sum(eta_j, axis=1)) / R0
+        # single RC pair is common, skip the reduction in that case
+        if model.num_RC_pairs == 1:
+            current = voltage + eta_j[:, 0]
+        else:
+            current = eta_j.sum(axis=1)
+            current += voltage
+
+        # update in place, avoids array-sized temporaries
+        current -= model.ocv(soc)
+        current /= R0
+        np.negative(current, out=current)
+
         capacity = cumulative_trapezoid(-current, x=time/3600., initial=0.)
 
         # stored time
@@ -121,8 +134,9 @@ class BaseSolution(SolverReturn):
         self.vars['capacity_Ah'] = soc[0]*model.capacity + capacity
         self.vars['eta0_V'] = current*R0
 
-        for j, eta in enumerate(eta_j.T, start=1):
-            self.vars['eta' + str(j) + '_V'] = eta
+        self.vars.update({
+            f"eta{j + 1}_V": eta_j[:, j] for j in range(eta_j.shape[1])
+        })
 
 
 class StepSolution(BaseSolution):
@@ -199,31 +213,39 @@ class CycleSolution(BaseSolution):
 
         sv_size = self._model._sv0.size
 
+        # each step starts 1e-3 s after the previous one ends
+        t_shift = 1e-3
+
+        sizes = np.array([soln.t.size for soln in self._solns])
+        bounds = np.concatenate(([0], np.cumsum(sizes)))
+
+        last_times = np.array([soln.t[-1] for soln in self._solns])
+        offsets = np.concatenate((
+            [0.], np.cumsum(last_times[:-1] + t_shift),
+        ))
+
         self._success = []
         self._message = []
-        self._t = np.empty([0])
-        self._y = np.empty([0, sv_size])
-        self._ydot = np.empty([0, sv_size])
+        self._t = np.empty(bounds[-1])
+        self._y = np.empty([bounds[-1], sv_size], order='F')
+        self._ydot = np.empty([bounds[-1], sv_size])
         self._roots = []
         self._tstop = []
         self._errors = []
-        self._timers = []
+        self._timers = np.empty(len(self._solns))
 
-        for soln in self._solns:
-            if self._t.size > 0:
-                shifted_times = self._t[-1] + soln.t + 1e-3
-            else:
-                shifted_times = soln.t
+        for i, soln in enumerate(self._solns):
+            start, stop = bounds[i], bounds[i + 1]
 
             self._success.append(soln.success)
             self._message.append(soln.message)
-            self._t = np.hstack([self._t, shifted_times])
-            self._y = np.vstack([self._y, soln.y])
-            self._ydot = np.vstack([self._ydot, soln.ydot])
+            self._t[start:stop] = offsets[i] + soln.t
+            self._y[start:stop] = soln.y
+            self._ydot[start:stop] = soln.ydot
             self._roots.append(soln.roots)
             self._tstop.append(soln.tstop)
             self._errors.append(soln.errors)
-            self._timers.append(soln._timer)
+            self._timers[i] = soln._timer
 
         self._to_dict()
 
@@ -238,7 +260,7 @@ class CycleSolution(BaseSolution):
             An f-string with the total solver integration time in seconds.
 
         """
-        return f"Solve time: {sum(self._timers):.3f} s"
+        return f"Solve time: {self._timers.sum():.3f} s"
 
     def get_steps(self, idx: int | tuple) -> StepSolution | CycleSolution:
         """
@@ -26,7 +26,7 @@ class Ramp:
     def __repr__(self) -> str:  # pragma: no cover
         return f"Ramp(m={self._m:.2e}, b={self._b:.2e})"
 
-    def __call__(self, t: float) -> float:
+    def __call__(self, t: float | np.ndarray) -> float | np.ndarray:
         return self._m*t + self._b
 
 
@@ -91,9 +91,12 @@ class Ramp2Constant:
 
         return f"Ramp2Constant({summary})"
 
-    def __call__(self, t: float) -> float:
+    def __call__(self, t: float | np.ndarray) -> float | np.ndarray:
 
         linear = self._m*t + self._b
-        sigmoid = 1. / (1. + np.exp(-self._sharpness*(linear - self._step)))
+        offset = self._step - linear
 
-        return (1. - sigmoid)*linear + sigmoid*self._step
+        # same as 1/(1 + exp(x)), but tanh cannot overflow for large x
+        sigmoid = 0.5 - 0.5*np.tanh(0.5*self._sharpness*offset)
+
+        return linear + sigmoid*offset
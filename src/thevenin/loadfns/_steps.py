@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+
 import numpy as np
 
 
 class StepFunction:
     """Piecewise step function."""
 
-    __slots__ = ('_tp', '_yp', '_func',)
+    __slots__ = ('_tp', '_yp', '_tp_list', '_yp_list',)
 
     def __init__(self, tp: np.ndarray, yp: np.ndarray, y0: float = 0.,
                  ignore_nan: bool = False) -> None:
@@ -70,44 +72,48 @@ class StepFunction:
         if tp.size != yp.size:
             raise ValueError("tp and yp must be same size.")
 
-        if any(np.diff(tp) <= 0.):
+        if np.any(tp[1:] <= tp[:-1]):
             raise ValueError("tp must be strictly increasing.")
 
-        self._tp = tp
-        self._yp = np.concatenate(([y0], yp, [yp[-1]]))
+        # numpy sorts NaN after inf, so a trailing NaN breakpoint gives NaN
+        # inputs their own bin and avoids a separate masking pass on calls
+        y_nan = yp[-1] if ignore_nan else np.nan
 
-        def func(t):
+        self._tp = np.concatenate((tp, [np.nan]))
+        self._yp = np.concatenate(([y0], yp, [y_nan]))
 
-            t = np.asarray(t)
-            if t.size == 1:
-                t = np.atleast_1d(t)
+        # plain lists for the scalar path, see __call__
+        self._tp_list = tp.tolist()
+        self._yp_list = self._yp.tolist()
 
-            idx = np.searchsorted(tp, t, side='right')
-            idx = np.clip(idx, 0, tp.size)
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"StepFunction(num_steps={self._tp.size - 1})"
 
-            y = self._yp[idx]
+    def __call__(self, t: float | np.ndarray) -> float | np.ndarray:
 
-            if not ignore_nan:
-                y[np.isnan(t)] = np.nan
+        # solvers call with scalars, where bisect beats numpy's overhead
+        if isinstance(t, (int, float)):
+            if t != t:
+                return self._yp_list[-1]
 
-            if y.size == 1:
-                return y.item()
-            else:
-                return y
+            return self._yp_list[bisect_right(self._tp_list, t)]
 
-        self._func = func
+        # idx is always within [0, tp.size], no clipping needed. Scalar
+        # inputs stay scalar all the way through, avoiding array copies.
+        idx = np.searchsorted(self._tp, t, side='right')
 
-    def __repr__(self) -> str:  # pragma: no cover
-        return f"StepFunction(num_steps={self._tp.size})"
+        y = self._yp[idx]
 
-    def __call__(self, t: np.ndarray) -> np.ndarray:
-        return self._func(t)
+        if y.size == 1:
+            return y.item()
+        else:
+            return y
 
 
 class RampedSteps:
     """Step function with ramps."""
 
-    __slots__ = ('_tp', '_yp', '_func', '_t_ramp',)
+    __slots__ = ('_tp', '_yp', '_t_ramp', '_tp_list', '_yp_list',)
 
     def __init__(self, tp: np.ndarray, yp: np.ndarray, t_ramp: float,
                  y0: float = 0.) -> None:
@@ -138,6 +144,8 @@ class RampedSteps:
             t_ramp must be strictly positive.
         ValueError
             tp must be strictly increasing.
+        ValueError
+            t_ramp must not exceed the smallest step interval in tp.
 
         See also
         --------
@@ -156,19 +164,29 @@ class RampedSteps:
         if t_ramp <= 0.:
             raise ValueError("t_ramp must be strictly positive.")
 
-        if any(np.diff(tp) <= 0.):
+        if np.any(tp[1:] <= tp[:-1]):
             raise ValueError("tp must be strictly increasing.")
 
-        tp = np.concatenate((tp, tp + t_ramp))
-        yp = np.concatenate(([y0], yp[:-1], yp))
+        if tp.size > 1 and t_ramp > np.diff(tp).min():
+            raise ValueError("t_ramp must not exceed the smallest step"
+                             " interval in tp.")
 
-        argsort = np.argsort(tp)
+        # ramps never overlap, so the breakpoints interleave without sorting.
+        # Ramps that end exactly where the next begins share the same value.
+        self._tp = np.empty(2*tp.size)
+        self._tp[0::2] = tp
+        self._tp[1::2] = tp + t_ramp
+
+        self._yp = np.empty(2*yp.size)
+        self._yp[0] = y0
+        self._yp[2::2] = yp[:-1]
+        self._yp[1::2] = yp
 
-        self._tp = tp[argsort]
-        self._yp = yp[argsort]
         self._t_ramp = t_ramp
 
-        self._func = lambda t: np.interp(t, self._tp, self._yp)
+        # plain lists for the scalar path, see __call__
+        self._tp_list = self._tp.tolist()
+        self._yp_list = self._yp.tolist()
 
     def __repr__(self) -> str:  # pragma: no cover
 
@@ -177,5 +195,54 @@ class RampedSteps:
 
         return f"RampedSteps(num_steps={num_steps}, t_ramp={t_ramp:.2e})"
 
-    def __call__(self, t: float) -> float:
-        return self._func(t)
+    def __call__(self, t: float | np.ndarray) -> float | np.ndarray:
+
+        # solvers call with scalars, where bisect beats numpy's overhead
+        if isinstance(t, (int, float)):
+            return _interp_scalar(t, self._tp_list, self._yp_list)
+
+        return np.interp(t, self._tp, self._yp)
+
+
+def _interp_scalar(t: float, tp: list[float], yp: list[float]) -> float:
+    """
+    Linearly interpolate a single value.
+
+    Pure-Python equivalent of ``np.interp`` for scalar 't', including its
+    handling of out-of-bounds, NaN, and non-finite values.
+
+    Parameters
+    ----------
+    t : float
+        Value at which to interpolate.
+    tp : list[float]
+        Strictly increasing interpolation points.
+    yp : list[float]
+        Values at each interpolation point.
+
+    Returns
+    -------
+    y : float
+        The interpolated value.
+
+    """
+
+    if t != t:
+        return t
+
+    j = bisect_right(tp, t) - 1
+
+    if j < 0:
+        return yp[0]
+    elif j == len(tp) - 1 or t == tp[j]:
+        return yp[j]
+
+    slope = (yp[j + 1] - yp[j]) / (tp[j + 1] - tp[j])
+
+    y = slope*(t - tp[j]) + yp[j]
+    if y != y:
+        y = slope*(t - tp[j + 1]) + yp[j + 1]
+        if y != y and yp[j] == yp[j + 1]:
+            y = yp[j]
+
+    return y
@@ -1,11 +1,12 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:  # pragma: no cover
-    from numpy import ndarray
+from functools import lru_cache
 
+import numpy as np
+import matplotlib as mpl
 
-def get_colors(size: int, data: ndarray = None, norm: ndarray = None,
+
+def get_colors(size: int, data: np.ndarray = None, norm: np.ndarray = None,
                alpha: float = 1., cmap: str = 'jet'):
     """
     Sample colors from 'cmap'.
@@ -41,12 +42,11 @@ def get_colors(size: int, data: ndarray = None, norm: ndarray = None,
         'data' length must match 'size'.
     ValueError
         'norm' length must equal 2.
+    ValueError
+        'norm' minimum must be less than or equal to its maximum.
 
     """
 
-    import numpy as np
-    import matplotlib as mpl
-
     if data is None:
         data = np.arange(size)
     elif len(data) != size:
@@ -57,11 +57,42 @@ def get_colors(size: int, data: ndarray = None, norm: ndarray = None,
     elif len(norm) != 2:
         raise ValueError(f"{len(norm)=} does not match 2.")
 
-    cmap = mpl.colormaps[cmap]
+    cmap = _get_cmap(cmap)
 
-    norm = mpl.colors.Normalize(vmin=norm[0], vmax=norm[1])
-    sm = mpl.pyplot.cm.ScalarMappable(cmap=cmap, norm=norm)
+    # same affine map as mpl.colors.Normalize, but without building objects
+    vmin, vmax = norm
+    if vmin > vmax:
+        raise ValueError(f"'norm' must be (min, max), but {vmin=} > {vmax=}.")
+    elif vmin == vmax:
+        normalized = np.zeros(size)
+    else:
+        normalized = (np.asarray(data, dtype=float) - vmin) / (vmax - vmin)
 
-    colors = [sm.to_rgba(x, alpha=alpha) for x in data]
+    rgba = cmap(normalized, alpha=alpha)
+
+    colors = [tuple(x) for x in rgba.tolist()]
 
     return colors
+
+
+@lru_cache(maxsize=16)
+def _get_cmap(name: str) -> mpl.colors.Colormap:
+    """
+    Return a cached colormap.
+
+    Looking up a colormap by name in the matplotlib registry returns a new
+    copy each time. Colormaps are only read here, so cache the lookups.
+
+    Parameters
+    ----------
+    name : str
+        A valid matplotlib colormap name.
+
+    Returns
+    -------
+    cmap : Colormap
+        The matplotlib colormap instance.
+
+    """
+
+    return mpl.colormaps[name]
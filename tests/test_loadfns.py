@@ -11,6 +11,7 @@ def test_ramp():
     yp = 5.*tp + 10.
 
     assert np.allclose(demand(tp), yp)
+    assert np.allclose([demand(t) for t in tp], demand(tp))
 
 
 def test_ramp_2_constant():
@@ -50,6 +51,7 @@ def test_ramp_2_constant():
     yp = 6.*np.ones_like(tp)
 
     assert np.allclose(demand(tp), yp)
+    assert np.allclose([demand(t) for t in tp], demand(tp))
 
     # negative ramp
     demand = thev.loadfns.Ramp2Constant(-6./1e-3, -6.)
@@ -64,6 +66,12 @@ def test_ramp_2_constant():
 
     assert np.allclose(demand(tp), yp)
 
+    # far from the transition, the sigmoid does not overflow
+    demand = thev.loadfns.Ramp2Constant(1., 10., sharpness=1e3)
+
+    with np.errstate(over='raise'):
+        assert np.allclose(demand(np.array([-1e3, 1e3])), [-1e3, 10.])
+
 
 def test_step_function():
 
@@ -96,9 +104,26 @@ def test_step_function():
     assert np.isnan(demand(np.nan))
     assert np.allclose(demand(t_test), y_test, equal_nan=True)
 
+    # NaN inputs are binned separately from +/- inf
+    t_test = np.array([np.nan, -np.inf, np.inf])
+    y_test = np.array([np.nan, -np.inf, 1])
+
+    assert np.allclose(demand(t_test), y_test, equal_nan=True)
+
+    # scalar inputs match array inputs, including exact breakpoint hits
+    t_test = np.array([-10, -np.inf, 0, 0.5, 1, 4, 5, 10, np.inf, np.nan])
+
+    assert np.allclose([demand(t) for t in t_test.tolist()], demand(t_test),
+                       equal_nan=True)
+    assert np.allclose([demand(t) for t in [-1, 0, 1, 5, 6]],
+                       demand(np.array([-1, 0, 1, 5, 6])))
+
     demand = thev.loadfns.StepFunction(tp, yp, -np.inf, ignore_nan=True)
 
     assert demand(np.nan) == yp[-1]
+    assert np.allclose(demand(np.array([np.nan, -np.inf, np.inf])),
+                       [1, -np.inf, 1])
+    assert np.allclose([demand(t) for t in t_test.tolist()], demand(t_test))
 
 
 def test_ramped_steps():
@@ -127,6 +152,24 @@ def test_ramped_steps():
         yp = np.array([-1, 0, 1])
         _ = thev.loadfns.RampedSteps(tp, yp, 1.)
 
+    # t_ramp must not exceed any step interval
+    with pytest.raises(ValueError):
+        tp = np.array([0, 1, 5])
+        yp = np.array([-1, 0, 1])
+        _ = thev.loadfns.RampedSteps(tp, yp, 2.)
+
+    # t_ramp equal to the smallest interval is allowed
+    tp = np.array([0, 1, 5])
+    yp = np.array([-1, 5, 10])
+
+    demand = thev.loadfns.RampedSteps(tp, yp, 1.)
+
+    t_test = np.array([-1, 0.5, 1, 1.5, 2, 3, 5.5, 10])
+    y_test = np.array([0, -0.5, -1, 2, 5, 5, 7.5, 10])
+
+    assert np.allclose(demand(t_test), y_test)
+    assert np.allclose([demand(t) for t in t_test], y_test)
+
     tp = np.array([0, 1, 5])
     yp = np.array([-1, 5, 10])
 
@@ -136,6 +179,8 @@ def test_ramped_steps():
     y_test = np.array([0, -1, 5, 10])
 
     assert np.allclose(demand(t_test), y_test)
+    assert np.allclose([demand(t) for t in t_test], y_test)
+    assert np.isnan(demand(np.nan))
 
     def ramp(t): return 0. + (-1. - 0.) / 1e-3 * t
     t_test = np.linspace(0, 1e-3, 10)
@@ -146,6 +191,7 @@ def test_ramped_steps():
     t_test = np.linspace(1, 1 + 1e-3, 10)
 
     assert np.allclose(demand(t_test), ramp(t_test))
+    assert np.allclose([demand(t) for t in t_test], ramp(t_test))
 
     def ramp(t): return 5. + (10. - 5.) / 1e-3 * (t - 5.)
     t_test = np.linspace(5, 5 + 1e-3, 10)
@@ -60,7 +60,7 @@ def model_2RC(dict_params):
     return model
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='module')
 def constant_steps():
     expr = thevenin.Experiment()
     expr.add_step('current_A', 1., (3600., 1.), limits=('voltage_V', 3.))
@@ -72,7 +72,7 @@ def constant_steps():
     return expr
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='module')
 def dynamic_current():
     def load(t): return np.sin(2.*np.pi*t / 120.)
 
@@ -82,7 +82,7 @@ def dynamic_current():
     return expr
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='module')
 def dynamic_voltage():
     def load(t): return 3.8 + 10e-3*np.sin(2.*np.pi*t / 120.)
 
@@ -92,7 +92,7 @@ def dynamic_voltage():
     return expr
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='module')
 def dynamic_power():
     def load(t): return np.sin(2.*np.pi*t / 120.)
 
@@ -167,8 +167,8 @@ def test_run_step(model_2RC, constant_steps):
 
     model_2RC.pre()
 
-    assert np.allclose(sv0, model_2RC._sv0)
-    assert np.allclose(svdot0, model_2RC._svdot0)
+    assert np.array_equal(sv0, model_2RC._sv0)
+    assert np.array_equal(svdot0, model_2RC._svdot0)
 
 
 def test_model_w_multistep_experiment(model_0RC, model_1RC, model_2RC,
@@ -242,10 +242,10 @@ def test_current_sign_convention(model_2RC, constant_steps):
     soln = model_2RC.run(constant_steps)
 
     discharge = soln.get_steps(0)
-    assert all(np.diff(discharge.vars['voltage_V']) < 0.)
+    assert np.all(np.diff(discharge.vars['voltage_V']) < 0.)
 
     charge = soln.get_steps(2)
-    assert all(np.diff(charge.vars['voltage_V']) > 0.)
+    assert np.all(np.diff(charge.vars['voltage_V']) > 0.)
 
 
 def test_constant_V_shift_w_constant_R0(model_0RC, constant_steps):
@@ -272,7 +272,7 @@ def test_isothermal_flag(model_2RC, constant_steps):
 
     soln = model_2RC.run(constant_steps)
     assert soln.vars['temperature_K'].max() > model_2RC.T_inf
-    assert all(soln.vars['temperature_K'] >= model_2RC.T_inf)
+    assert np.all(soln.vars['temperature_K'] >= model_2RC.T_inf)
 
     # with heat off
     model_2RC.isothermal = True
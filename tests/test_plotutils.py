@@ -12,6 +12,10 @@ def test_get_colors():
     with pytest.raises(ValueError):
         _ = thev.plotutils.get_colors(3, norm=[1, 2, 3])
 
+    # 'norm' min > max
+    with pytest.raises(ValueError):
+        _ = thev.plotutils.get_colors(3, norm=[5, 0])
+
     colors = thev.plotutils.get_colors(3)
     assert len(colors) == 3
 
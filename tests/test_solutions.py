@@ -9,9 +9,9 @@ import matplotlib.pyplot as plt
 @pytest.fixture(scope='function')
 def soln():
 
-    warnings.filterwarnings('ignore')
-
-    model = thevenin.Model()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        model = thevenin.Model()
 
     expr = thevenin.Experiment()
     expr.add_step('current_A', 1., (3600., 1.), limits=('voltage_V', 3.))
@@ -28,10 +28,13 @@ def test_step_and_cycle_solutions(soln):
     step_soln = soln.get_steps(0)
     assert step_soln.solvetime
 
-    # bad plot
+    # bad plot, without opening a figure
+    num_figs = len(plt.get_fignums())
     with pytest.raises(KeyError):
         step_soln.plot('fake', 'plot')
 
+    assert len(plt.get_fignums()) == num_figs
+
     # plots w/ and w/o units
     step_soln.plot('soc', 'soc')
     step_soln.plot('time_h', 'voltage_V')
@@ -40,7 +43,7 @@ def test_step_and_cycle_solutions(soln):
     # solvetime works and times stacked correctly
     cycle_soln = soln.get_steps((0, 1))
     assert cycle_soln.solvetime
-    assert all(np.diff(cycle_soln.t) >= 0.)
+    assert np.all(np.diff(cycle_soln.t) >= 0.)
 
     # bad plot
     with pytest.raises(KeyError):
@@ -50,3 +53,14 @@ def test_step_and_cycle_solutions(soln):
     cycle_soln.plot('soc', 'soc')
     cycle_soln.plot('time_h', 'voltage_V')
     plt.close('all')
+
+
+def test_get_steps_is_independent(soln):
+
+    # single steps are deep copies, and share no arrays with the original
+    step_soln = soln.get_steps(0)
+    original = soln._solns[0]
+
+    assert isinstance(step_soln.vars, dict)
+    assert step_soln.vars['current_A'] is not original.vars['current_A']
+    assert np.allclose(step_soln.vars['current_A'], original.vars['current_A'])